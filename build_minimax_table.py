@@ -0,0 +1,41 @@
+"""Precompute the Hard AI's move for every reachable board and write minimax.json"""
+from typing import Dict, Tuple
+
+from v2 import AI, Difficulty, MINIMAX_TABLE_PATH
+
+
+def collect_moves(ai: AI, x_mask: int, o_mask: int, current: str, human: str,
+                  table: Dict[str, Tuple[int, int]]):
+    """Walk every reachable board, recording the AI's best move on its turns"""
+    if ai._check_winner(x_mask, o_mask) or ai._is_board_full(x_mask, o_mask):
+        return
+
+    if current == ai.symbol:
+        key = AI.board_key(x_mask, o_mask)
+        if key in table:
+            return
+        table[key] = ai.search_minimax_move(x_mask, o_mask, human)
+
+    next_player = human if current == ai.symbol else ai.symbol
+    for i in range(9):
+        bit = 1 << i
+        if not (x_mask | o_mask) & bit:
+            collect_moves(ai, *AI._play(x_mask, o_mask, bit, current), next_player, human, table)
+
+
+def main():
+    """Build the lookup table and save it next to v2.py"""
+    ai = AI(Difficulty.HARD)
+    table = {}
+    collect_moves(ai, 0, 0, 'X', 'X', table)
+
+    with open(MINIMAX_TABLE_PATH, 'w') as f:
+        f.write("{\n")
+        f.write(",\n".join(f'"{key}": [{row}, {col}]' for key, (row, col) in sorted(table.items())))
+        f.write("\n}\n")
+
+    print(f"Wrote {len(table)} positions to {MINIMAX_TABLE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 import pygame
+import os
 import sys
+import json
+import time
 import random
 import math
 from enum import Enum
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 # Initialize Pygame
 pygame.init()
@@ -15,18 +18,65 @@ BOARD_SIZE = 400
 CELL_SIZE = BOARD_SIZE // 3
 BOARD_X = (WINDOW_WIDTH - BOARD_SIZE) // 2
 BOARD_Y = 100
+AI_MOVE_DELAY = 500  # Milliseconds before the AI plays, for better UX
+FPS = 60  # Frame rate when the display's refresh rate is unknown
+IDLE_WAIT_MS = 100  # Longest wait for input when nothing on screen is animating
+# Sent when part of the window is uncovered; WINDOWEXPOSED is new in pygame 2.0.1
+WINDOW_EXPOSED = getattr(pygame, 'WINDOWEXPOSED', pygame.VIDEOEXPOSE)
 
 # Colors
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-BLUE = (0, 100, 200)
-RED = (200, 0, 0)
-GREEN = (0, 200, 0)
-GRAY = (128, 128, 128)
-LIGHT_GRAY = (200, 200, 200)
-DARK_GRAY = (64, 64, 64)
-YELLOW = (255, 255, 0)
-ORANGE = (255, 165, 0)
+WHITE = pygame.Color(255, 255, 255)
+BLACK = pygame.Color(0, 0, 0)
+BLUE = pygame.Color(0, 100, 200)
+RED = pygame.Color(200, 0, 0)
+GREEN = pygame.Color(0, 200, 0)
+GRAY = pygame.Color(128, 128, 128)
+LIGHT_GRAY = pygame.Color(200, 200, 200)
+DARK_GRAY = pygame.Color(64, 64, 64)
+YELLOW = pygame.Color(255, 255, 0)
+ORANGE = pygame.Color(255, 165, 0)
+
+# Boards are flat 9-cell lists: cell (row, col) is index row * 3 + col
+WIN_INDICES = [
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Columns
+    (0, 4, 8), (2, 4, 6),  # Diagonals
+]
+# How draw_winning_line identifies each of WIN_INDICES
+WIN_LINES = [('row', 0), ('row', 1), ('row', 2), ('col', 0), ('col', 1), ('col', 2), ('diag', 0), ('diag', 1)]
+
+# AI bitmasks use the same numbering: cell index i is bit i
+FULL_BOARD = 0x1FF
+WIN_MASKS = [sum(1 << i for i in line) for line in WIN_INDICES]
+# Whether each possible 9-bit mask contains a winning line
+HAS_LINE = [any(mask & win == win for win in WIN_MASKS) for mask in range(FULL_BOARD + 1)]
+# The (row, col) cells left empty by each possible occupied-cells mask
+EMPTY_CELLS = [
+    tuple(divmod(i, 3) for i in range(9) if not mask >> i & 1) for mask in range(FULL_BOARD + 1)
+]
+
+# Cell bits in search order: center, corners, then edges
+MOVE_ORDER = [1 << i for i in (4, 0, 2, 6, 8, 1, 3, 5, 7)]
+
+# The 8 symmetries of the board: cell i of the transformed board is cell perm[i]
+SYMMETRIES = [
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # Identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # Rotate 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # Rotate 180
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # Rotate 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # Flip horizontal
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # Flip vertical
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # Main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # Anti-diagonal
+]
+# Lookup tables mapping every 9-bit mask to its image under each symmetry
+SYMMETRY_MASKS = [
+    [sum(1 << i for i in range(9) if mask >> perm[i] & 1) for mask in range(FULL_BOARD + 1)]
+    for perm in SYMMETRIES
+]
+
+# Precomputed Hard AI moves (generated by build_minimax_table.py)
+MINIMAX_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'minimax.json')
 
 
 class GameState(Enum):
@@ -53,155 +103,296 @@ class Player:
         self.score = 0
 
 
+# Minimax scores lie in [-10, 10]; this int bound keeps comparisons off floats
+INFINITE_SCORE = 100
+
+# Transposition table entry flags
+TT_EXACT = 0
+TT_LOWER_BOUND = 1
+TT_UPPER_BOUND = 2
+
+
+def minimax(ai_mask: int, player_mask: int, depth: int, depth_limit: int, is_maximizing: bool,
+            alpha: int, beta: int, tt: Dict[int, Tuple[int, int, int, int]], pv: Dict[int, int]) -> int:
+    """Depth-limited minimax with alpha-beta pruning and a transposition table, on AI/player bitmasks"""
+    if HAS_LINE[ai_mask]:
+        return 10 - depth
+    if HAS_LINE[player_mask]:
+        return depth - 10
+    occupied = ai_mask | player_mask
+    if occupied == FULL_BOARD:
+        return 0
+    if depth >= depth_limit:
+        return 0  # Outcome beyond the search horizon is unknown
+
+    # Scores depend on depth, so only reuse entries found at the same depth
+    # and searched at least as far below it
+    remaining = depth_limit - depth
+    key = (ai_mask << 10) | (player_mask << 1) | is_maximizing
+    entry = tt.get(key)
+    if entry is not None and entry[0] == depth and entry[1] >= remaining:
+        _, _, score, flag = entry
+        if flag == TT_EXACT:
+            return score
+        elif flag == TT_LOWER_BOUND:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+        if beta <= alpha:
+            return score
+
+    original_alpha, original_beta = alpha, beta
+
+    # Try the best move from an earlier, shallower search first
+    pv_move = pv.get(key)
+    moves = MOVE_ORDER if pv_move is None else [pv_move] + [bit for bit in MOVE_ORDER if bit != pv_move]
+    best_move = None
+
+    if is_maximizing:
+        best_score = -INFINITE_SCORE
+        for bit in moves:
+            if occupied & bit:
+                continue
+            score = minimax(ai_mask | bit, player_mask, depth + 1, depth_limit, False, alpha, beta, tt, pv)
+            if score > best_score:
+                best_score = score
+                best_move = bit
+            alpha = max(alpha, best_score)
+            if beta <= alpha:
+                break
+    else:
+        best_score = INFINITE_SCORE
+        for bit in moves:
+            if occupied & bit:
+                continue
+            score = minimax(ai_mask, player_mask | bit, depth + 1, depth_limit, True, alpha, beta, tt, pv)
+            if score < best_score:
+                best_score = score
+                best_move = bit
+            beta = min(beta, best_score)
+            if beta <= alpha:
+                break
+
+    if best_score <= original_alpha:
+        flag = TT_UPPER_BOUND
+    elif best_score >= original_beta:
+        flag = TT_LOWER_BOUND
+    else:
+        flag = TT_EXACT
+    tt[key] = (depth, remaining, best_score, flag)
+    pv[key] = best_move
+    return best_score
+
+
 class AI:
     """AI player with different difficulty levels"""
 
     def __init__(self, difficulty: Difficulty):
         self.difficulty = difficulty
         self.symbol = 'O'
-
-    def get_move(self, board: List[List[str]], player_symbol: str = 'X') -> Tuple[int, int]:
+        self.table = self._load_table() if difficulty == Difficulty.HARD else {}
+        self.tt = {}  # Packed board and side to move -> (depth, remaining depth, score, flag)
+        self.pv = {}  # Packed board and side to move -> best move bit from the last search
+
+    @staticmethod
+    def _load_table() -> Dict[str, Tuple[int, int]]:
+        """Load precomputed minimax moves, or an empty table if unavailable"""
+        try:
+            with open(MINIMAX_TABLE_PATH) as f:
+                return {key: tuple(move) for key, move in json.load(f).items()}
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def to_masks(board: List[str]) -> Tuple[int, int]:
+        """Convert a board to (x_mask, o_mask) bitmasks"""
+        x_mask = o_mask = 0
+        for i, cell in enumerate(board):
+            if cell == 'X':
+                x_mask |= 1 << i
+            elif cell == 'O':
+                o_mask |= 1 << i
+        return x_mask, o_mask
+
+    @staticmethod
+    def board_key(x_mask: int, o_mask: int) -> str:
+        """Encode board as a 9-character string, using spaces for empty cells"""
+        return "".join('X' if x_mask >> i & 1 else 'O' if o_mask >> i & 1 else ' ' for i in range(9))
+
+    @staticmethod
+    def _to_cell(bit: int) -> Tuple[int, int]:
+        """Convert a single-bit mask to (row, col)"""
+        return divmod(bit.bit_length() - 1, 3)
+
+    def get_move(self, board: List[str], player_symbol: str = 'X') -> Tuple[int, int]:
         """Get AI move based on difficulty"""
+        x_mask, o_mask = self.to_masks(board)
         if self.difficulty == Difficulty.EASY:
-            return self._get_random_move(board)
+            return self._get_random_move(x_mask, o_mask)
         elif self.difficulty == Difficulty.MEDIUM:
-            return self._get_medium_move(board, player_symbol)
+            return self._get_medium_move(x_mask, o_mask, player_symbol)
         else:  # HARD
-            return self._get_minimax_move(board, player_symbol)
+            return self._get_minimax_move(x_mask, o_mask, player_symbol)
 
-    def _get_random_move(self, board: List[List[str]]) -> Tuple[int, int]:
+    def _get_random_move(self, x_mask: int, o_mask: int) -> Tuple[int, int]:
         """Get random available move"""
-        available_moves = []
-        for i in range(3):
-            for j in range(3):
-                if board[i][j] == '':
-                    available_moves.append((i, j))
+        available_moves = EMPTY_CELLS[x_mask | o_mask]
         return random.choice(available_moves) if available_moves else (0, 0)
 
-    def _get_medium_move(self, board: List[List[str]], player_symbol: str) -> Tuple[int, int]:
+    def _get_medium_move(self, x_mask: int, o_mask: int, player_symbol: str) -> Tuple[int, int]:
         """Medium difficulty: Block player wins, otherwise random"""
         # First, try to block player from winning
-        for i in range(3):
-            for j in range(3):
-                if board[i][j] == '':
-                    # Try this move
-                    board[i][j] = player_symbol
-                    if self._check_winner(board) == player_symbol:
-                        board[i][j] = ''  # Undo
-                        return (i, j)
-                    board[i][j] = ''  # Undo
+        block = self._find_winning_move(x_mask, o_mask, player_symbol)
+        if block is not None:
+            return block
 
         # If no blocking needed, make random move
-        return self._get_random_move(board)
-
-    def _get_minimax_move(self, board: List[List[str]], player_symbol: str) -> Tuple[int, int]:
-        """Hard difficulty: Use minimax algorithm"""
-        best_score = -math.inf
-        best_move = (0, 0)
-
-        for i in range(3):
-            for j in range(3):
-                if board[i][j] == '':
-                    board[i][j] = self.symbol
-                    score = self._minimax(board, 0, False, player_symbol)
-                    board[i][j] = ''
-
-                    if score > best_score:
-                        best_score = score
-                        best_move = (i, j)
-
-        return best_move
-
-    def _minimax(self, board: List[List[str]], depth: int, is_maximizing: bool, player_symbol: str) -> int:
-        """Minimax algorithm implementation"""
-        winner = self._check_winner(board)
-
-        if winner == self.symbol:
-            return 10 - depth
-        elif winner == player_symbol:
-            return depth - 10
-        elif self._is_board_full(board):
-            return 0
-
-        if is_maximizing:
-            best_score = -math.inf
-            for i in range(3):
-                for j in range(3):
-                    if board[i][j] == '':
-                        board[i][j] = self.symbol
-                        score = self._minimax(board, depth + 1, False, player_symbol)
-                        board[i][j] = ''
-                        best_score = max(score, best_score)
-            return best_score
-        else:
-            best_score = math.inf
-            for i in range(3):
-                for j in range(3):
-                    if board[i][j] == '':
-                        board[i][j] = player_symbol
-                        score = self._minimax(board, depth + 1, True, player_symbol)
-                        board[i][j] = ''
-                        best_score = min(score, best_score)
-            return best_score
-
-    def _check_winner(self, board: List[List[str]]) -> Optional[str]:
-        """Check if there's a winner"""
-        # Check rows
-        for row in board:
-            if row[0] == row[1] == row[2] and row[0] != '':
-                return row[0]
-
-        # Check columns
-        for col in range(3):
-            if board[0][col] == board[1][col] == board[2][col] and board[0][col] != '':
-                return board[0][col]
-
-        # Check diagonals
-        if board[0][0] == board[1][1] == board[2][2] and board[0][0] != '':
-            return board[0][0]
-        if board[0][2] == board[1][1] == board[2][0] and board[0][2] != '':
-            return board[0][2]
+        return self._get_random_move(x_mask, o_mask)
+
+    def _find_winning_move(self, x_mask: int, o_mask: int, symbol: str) -> Optional[Tuple[int, int]]:
+        """Find a move that immediately wins for symbol, if any"""
+        occupied = x_mask | o_mask
+        for bit in MOVE_ORDER:
+            if occupied & bit:
+                continue
+            if self._check_winner(*self._play(x_mask, o_mask, bit, symbol)) == symbol:
+                return self._to_cell(bit)
+        return None
 
+    def _get_minimax_move(self, x_mask: int, o_mask: int, player_symbol: str) -> Tuple[int, int]:
+        """Hard difficulty: Look up precomputed move, falling back to minimax search"""
+        move = self.table.get(self.board_key(x_mask, o_mask))
+        if move is not None:
+            return move
+        return self.search_minimax_move(x_mask, o_mask, player_symbol)
+
+    def search_minimax_move(self, x_mask: int, o_mask: int, player_symbol: str) -> Tuple[int, int]:
+        """Find the best move by running the minimax algorithm"""
+        # The center is a perfect opening move
+        if not (x_mask | o_mask):
+            return (1, 1)
+
+        # Take an immediate win, otherwise block the player's
+        win = self._find_winning_move(x_mask, o_mask, self.symbol)
+        if win is not None:
+            return win
+        block = self._find_winning_move(x_mask, o_mask, player_symbol)
+        if block is not None:
+            return block
+
+        ai_mask, player_mask = (x_mask, o_mask) if self.symbol == 'X' else (o_mask, x_mask)
+        empty_cells = 9 - bin(x_mask | o_mask).count('1')
+
+        # Iterative deepening: each pass orders moves using the previous pass's best moves
+        best_move = None
+        for depth_limit in range(empty_cells):
+            score, best_move = self._search_root(ai_mask, player_mask, depth_limit)
+            if score != 0:
+                break  # A forced win or loss has been proven
+
+        return self._to_cell(best_move)
+
+    def _search_root(self, ai_mask: int, player_mask: int, depth_limit: int) -> Tuple[int, int]:
+        """Search every root move to depth_limit, returning the best score and move bit"""
+        best_score = -INFINITE_SCORE
+        best_move = None
+        seen = set()
+
+        key = (ai_mask << 10) | (player_mask << 1) | True
+        pv_move = self.pv.get(key)
+        moves = MOVE_ORDER if pv_move is None else [pv_move] + [bit for bit in MOVE_ORDER if bit != pv_move]
+
+        occupied = ai_mask | player_mask
+        for bit in moves:
+            if occupied & bit:
+                continue
+
+            # Moves that lead to a rotation or reflection of an earlier child score the same
+            canonical = self._canonical(ai_mask | bit, player_mask)
+            if canonical in seen:
+                continue
+            seen.add(canonical)
+
+            score = minimax(ai_mask | bit, player_mask, 0, depth_limit, False, best_score, INFINITE_SCORE,
+                            self.tt, self.pv)
+
+            if score > best_score:
+                best_score = score
+                best_move = bit
+
+        self.pv[key] = best_move
+        return best_score, best_move
+
+    @staticmethod
+    def _canonical(x_mask: int, o_mask: int) -> Tuple[int, int]:
+        """Return the smallest of the board's 8 symmetric variants"""
+        return min((table[x_mask], table[o_mask]) for table in SYMMETRY_MASKS)
+
+    @staticmethod
+    def _play(x_mask: int, o_mask: int, bit: int, symbol: str) -> Tuple[int, int]:
+        """Return the masks after placing symbol on the given cell bit"""
+        if symbol == 'X':
+            return x_mask | bit, o_mask
+        return x_mask, o_mask | bit
+
+    def _check_winner(self, x_mask: int, o_mask: int) -> Optional[str]:
+        """Check if there's a winner"""
+        if HAS_LINE[x_mask]:
+            return 'X'
+        if HAS_LINE[o_mask]:
+            return 'O'
         return None
 
-    def _is_board_full(self, board: List[List[str]]) -> bool:
+    def _is_board_full(self, x_mask: int, o_mask: int) -> bool:
         """Check if board is full"""
-        for row in board:
-            for cell in row:
-                if cell == '':
-                    return False
-        return True
+        return (x_mask | o_mask) == FULL_BOARD
+
+
+class SilentSound:
+    """Stand-in for a missing sound effect"""
+
+    def play(self):
+        """Do nothing"""
+
+
+SILENT_SOUND = SilentSound()
 
 
 class Button:
     """Simple button class for UI"""
 
-    def __init__(self, x: int, y: int, width: int, height: int, text: str, color: Tuple[int, int, int] = LIGHT_GRAY):
+    def __init__(self, x: int, y: int, width: int, height: int, text: str, color: pygame.Color = LIGHT_GRAY):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.color = color
-        self.hover_color = (min(255, color[0] + 30), min(255, color[1] + 30), min(255, color[2] + 30))
+        self.hover_color = pygame.Color(min(255, color[0] + 30), min(255, color[1] + 30), min(255, color[2] + 30))
         self.is_hovered = False
         self.font = pygame.font.Font(None, 24)
+        text_surface = self.font.render(text, True, BLACK).convert_alpha()
+        self.normal_surface = self.compose(self.color, text_surface)
+        self.hover_surface = self.compose(self.hover_color, text_surface)
+
+    def compose(self, color: pygame.Color, text_surface: pygame.Surface) -> pygame.Surface:
+        """Pre-render the button background, border and label"""
+        surface = pygame.Surface(self.rect.size)
+        surface.fill(color)
+        pygame.draw.rect(surface, BLACK, surface.get_rect(), 2)
+        surface.blit(text_surface, text_surface.get_rect(center=surface.get_rect().center))
+        return surface.convert()
+
+    @property
+    def surface(self) -> pygame.Surface:
+        """Button image for the current hover state"""
+        return self.hover_surface if self.is_hovered else self.normal_surface
 
     def draw(self, screen: pygame.Surface):
         """Draw button on screen"""
-        color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, BLACK, self.rect, 2)
+        screen.blit(self.surface, self.rect)
 
-        text_surface = self.font.render(self.text, True, BLACK)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
-
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        """Handle mouse events"""
-        if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
-                return True
-        return False
+    @staticmethod
+    def draw_many(screen: pygame.Surface, buttons):
+        """Draw several buttons on screen with a single blits call"""
+        screen.blits([(button.surface, button.rect) for button in buttons], doreturn=False)
 
 
 class InputBox:
@@ -214,6 +405,8 @@ class InputBox:
         self.placeholder = placeholder
         self.font = pygame.font.Font(None, 24)
         self.active = False
+        self.text_surface = None
+        self.rendered_text = None  # Text that text_surface was rendered from
 
     def handle_event(self, event: pygame.event.Event):
         """Handle input events"""
@@ -232,10 +425,13 @@ class InputBox:
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, BLACK, self.rect, 2)
 
-        display_text = self.text if self.text else self.placeholder
-        text_color = BLACK if self.text else GRAY
-        text_surface = self.font.render(display_text, True, text_color)
-        screen.blit(text_surface, (self.rect.x + 5, self.rect.y + 5))
+        # Only re-render when the text has changed since the last draw
+        if self.text_surface is None or self.text != self.rendered_text:
+            display_text = self.text if self.text else self.placeholder
+            text_color = BLACK if self.text else GRAY
+            self.text_surface = self.font.render(display_text, True, text_color).convert_alpha()
+            self.rendered_text = self.text
+        screen.blit(self.text_surface, (self.rect.x + 5, self.rect.y + 5))
 
 
 class GameManager:
@@ -244,17 +440,32 @@ class GameManager:
     def __init__(self):
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Tic-Tac-Toe")
-        self.clock = pygame.time.Clock()
         self.running = True
 
+        # Draw animations at the display's refresh rate
+        refresh_rate = self.get_refresh_rate()
+        self.frame_ns = 1_000_000_000 // refresh_rate
+
+        # Only queue the events the game reacts to. Every screen has hover
+        # feedback, so mouse motion stays allowed; expose events trigger a redraw.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION,
+                                  pygame.VIDEOEXPOSE, WINDOW_EXPOSED])
+
         # Game state
         self.state = GameState.MENU
-        self.board = [['', '', ''] for _ in range(3)]
+        self.board = [''] * 9
+        self.move_count = 0
         self.current_player = 'X'
         self.game_mode = None  # 'single' or 'two_player'
         self.difficulty = None
         self.winner = None
         self.winning_line = None
+        self.ai_pending = False
+        self.ai_move_at = 0
+        self.game_over_layer = None  # Everything drawn over the board, rendered on entering GAME_OVER
+        self.score_blits = []  # In-game score lines, rendered for last_scores
+        self.last_scores = None
 
         # Players
         self.player1 = None
@@ -263,29 +474,59 @@ class GameManager:
 
         # UI Elements
         self.buttons = {}
+        self.hovered_button = None
         self.input_boxes = {}
+        self.text_cache = {}  # (font key, text, color, center) -> (surface, top-left position)
         self.fonts = {
             'title': pygame.font.Font(None, 48),
             'large': pygame.font.Font(None, 36),
             'medium': pygame.font.Font(None, 24),
             'small': pygame.font.Font(None, 18)
         }
+        self.center_x = WINDOW_WIDTH // 2  # Horizontal center of the window, for centered text
 
         # Animation
-        self.animation_timer = 0
+        self.animation_timer = 0  # In 60ths of a second
+        self.animation_step = FPS / refresh_rate  # Timer advance per frame
         self.cell_hover = None
+        self.pulse_colors = (pygame.Color(GREEN), pygame.Color(YELLOW))  # Winning line colors
+        self.dirty = True  # Whether the screen needs to be redrawn
+        self.drawn_state = None  # State last shown on the display, None to update all of it
 
         # Sound effects (placeholders - add actual sound files)
-        self.sounds = {
+        sounds = {
             'move': None,  # pygame.mixer.Sound('move.wav')
             'win': None,  # pygame.mixer.Sound('win.wav')
             'click': None  # pygame.mixer.Sound('click.wav')
         }
+        self.sounds = {name: sound or SILENT_SOUND for name, sound in sounds.items()}
 
         self.setup_ui()
+        self.setup_surfaces()
+
+        # Per-state event and draw methods
+        self.event_handlers = {
+            GameState.MENU: self.handle_menu_events,
+            GameState.MODE_SELECT: self.handle_mode_select_events,
+            GameState.DIFFICULTY_SELECT: self.handle_difficulty_select_events,
+            GameState.NAME_INPUT: self.handle_name_input_events,
+            GameState.PLAYING: self.handle_game_events,
+            GameState.GAME_OVER: self.handle_game_over_events,
+        }
+        self.draw_handlers = {
+            GameState.MENU: self.draw_menu,
+            GameState.MODE_SELECT: self.draw_mode_select,
+            GameState.DIFFICULTY_SELECT: self.draw_difficulty_select,
+            GameState.NAME_INPUT: self.draw_name_input,
+            GameState.PLAYING: self.draw_game,
+            GameState.GAME_OVER: self.draw_game_over,
+        }
 
     def setup_ui(self):
         """Setup UI elements for different states"""
+        # Everything below is converted to the display's pixel format
+        assert pygame.display.get_surface() is not None, "set the display mode before creating the UI"
+
         # Menu buttons
         self.buttons['start'] = Button(350, 250, 100, 50, "Start Game", GREEN)
         self.buttons['exit'] = Button(350, 320, 100, 50, "Exit", RED)
@@ -304,68 +545,188 @@ class GameManager:
         self.buttons['play_again'] = Button(250, 450, 120, 50, "Play Again", GREEN)
         self.buttons['main_menu'] = Button(400, 450, 120, 50, "Main Menu", BLUE)
 
+        # Buttons shown on each screen, drawn together. Their rects are kept in
+        # parallel lists so the mouse is hit-tested against a whole screen at once.
+        self.button_keys = {
+            'menu': ('start', 'exit'),
+            'mode_select': ('single', 'two_player', 'back'),
+            'difficulty_select': ('easy', 'medium', 'hard', 'back'),
+            'name_input': ('back',),
+            'game_over': ('play_again', 'main_menu'),
+        }
+        self.button_groups = {screen: [self.buttons[key] for key in keys] for screen, keys in self.button_keys.items()}
+        self.button_rects = {screen: [button.rect for button in buttons]
+                             for screen, buttons in self.button_groups.items()}
+
         # Input boxes
         self.input_boxes['player1'] = InputBox(300, 200, 200, 30, "Player 1 Name")
         self.input_boxes['player2'] = InputBox(300, 250, 200, 30, "Player 2 Name")
         self.input_boxes['single_player'] = InputBox(300, 200, 200, 30, "Your Name")
 
+        # Parts of each screen that can change while staying on it. Typed
+        # names may run past their box, so input rows span the window.
+        self.screen_rect = self.screen.get_rect()
+        self.update_rects = {
+            GameState.MENU: self.button_rects['menu'],
+            GameState.MODE_SELECT: self.button_rects['mode_select'],
+            GameState.DIFFICULTY_SELECT: self.button_rects['difficulty_select'],
+            GameState.NAME_INPUT: [pygame.Rect(0, box.rect.y, WINDOW_WIDTH, box.rect.height)
+                                   for box in self.input_boxes.values()] + self.button_rects['name_input'],
+            GameState.PLAYING: [self.screen_rect],
+            GameState.GAME_OVER: [pygame.Rect(BOARD_X, BOARD_Y, BOARD_SIZE + 1, BOARD_SIZE + 1)]
+                                 + self.button_rects['game_over'],
+        }
+
+        # Static text, rendered once
+        self.titles = {
+            'menu': self.render_text('title', "Tic-Tac-Toe", BLACK, (self.center_x, 150)),
+            'mode_select': self.render_text('large', "Select Game Mode", BLACK, (self.center_x, 100)),
+            'difficulty_select': self.render_text('large', "Select Difficulty", BLACK, (self.center_x, 100)),
+            'name_single': self.render_text('large', "Enter Your Name", BLACK, (self.center_x, 150)),
+            'name_two': self.render_text('large', "Enter Player Names", BLACK, (self.center_x, 150)),
+            'start_single': self.render_text('medium', "Press Enter to start", GRAY, (self.center_x, 280)),
+            'start_two': self.render_text('medium', "Press Enter to start", GRAY, (self.center_x, 320)),
+            'game': self.render_text('large', "Tic-Tac-Toe", BLACK, (self.center_x, 30)),
+        }
+
+    def setup_surfaces(self):
+        """Pre-render the static board grid and the X and O symbols"""
+        # One extra pixel so the grid lines' end points are not clipped
+        self.board_surface = pygame.Surface((BOARD_SIZE + 1, BOARD_SIZE + 1), pygame.SRCALPHA)
+        for i in range(1, 3):
+            # Vertical lines
+            pygame.draw.line(self.board_surface, BLACK, (i * CELL_SIZE, 0), (i * CELL_SIZE, BOARD_SIZE), 3)
+            # Horizontal lines
+            pygame.draw.line(self.board_surface, BLACK, (0, i * CELL_SIZE), (BOARD_SIZE, i * CELL_SIZE), 3)
+
+        # Board border
+        pygame.draw.rect(self.board_surface, BLACK, (0, 0, BOARD_SIZE, BOARD_SIZE), 3)
+
+        center = CELL_SIZE // 2
+        margin = 30
+        x_surface = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+        pygame.draw.line(x_surface, RED, (center - margin, center - margin), (center + margin, center + margin), 8)
+        pygame.draw.line(x_surface, RED, (center + margin, center - margin), (center - margin, center + margin), 8)
+        o_surface = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+        pygame.draw.circle(o_surface, BLUE, (center, center), 40, 8)
+        self.symbol_surfaces = {'X': x_surface.convert_alpha(), 'O': o_surface.convert_alpha()}
+        self.board_surface = self.board_surface.convert_alpha()
+
+    def render_text(self, font_key: str, text: str, color: pygame.Color,
+                    center: Tuple[int, int]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Render text and return the surface with the top-left position that centers it at center"""
+        surface = self.fonts[font_key].render(text, True, color).convert_alpha()
+        return surface, (center[0] - surface.get_width() // 2, center[1] - surface.get_height() // 2)
+
+    def render_cached(self, font_key: str, text: str, color: pygame.Color,
+                      center: Tuple[int, int]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Like render_text, but reuse the result for text drawn on consecutive frames"""
+        key = (font_key, text, tuple(color), center)
+        cached = self.text_cache.get(key)
+        if cached is None:
+            cached = self.text_cache[key] = self.render_text(font_key, text, color, center)
+        return cached
+
+    @property
+    def needs_animation(self) -> bool:
+        """Whether the screen changes without input (a pending AI move or the winning line)"""
+        return self.ai_pending or self.winning_line is not None
+
     def handle_events(self):
         """Handle all game events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-
-            # Handle UI events based on current state
-            if self.state == GameState.MENU:
-                self.handle_menu_events(event)
-            elif self.state == GameState.MODE_SELECT:
-                self.handle_mode_select_events(event)
-            elif self.state == GameState.DIFFICULTY_SELECT:
-                self.handle_difficulty_select_events(event)
-            elif self.state == GameState.NAME_INPUT:
-                self.handle_name_input_events(event)
-            elif self.state == GameState.PLAYING:
-                self.handle_game_events(event)
-            elif self.state == GameState.GAME_OVER:
-                self.handle_game_over_events(event)
+        if self.dirty or self.needs_animation:
+            events = pygame.event.get()
+        else:
+            # Nothing to draw until the user does something, so sleep in SDL
+            # until an event arrives, then drain any backlog behind it
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+
+        for event in events:
+            self.dispatch_event(event)
+
+    def dispatch_event(self, event: pygame.event.Event):
+        """Handle a single event"""
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.VIDEOEXPOSE or event.type == WINDOW_EXPOSED:
+            self.drawn_state = None  # The window was uncovered, so update all of it
+
+        # Handle UI events based on current state. Mouse movement only needs
+        # a redraw when it changes what is highlighted; anything else might
+        # change the screen.
+        if event.type == pygame.MOUSEMOTION:
+            highlighted = self.get_highlighted()
+            self.event_handlers[self.state](event)
+            if self.get_highlighted() != highlighted:
+                self.dirty = True
+        else:
+            self.event_handlers[self.state](event)
+            self.dirty = True
+
+    def get_highlighted(self) -> Tuple:
+        """Get the hovered board cell and button"""
+        return self.cell_hover, self.hovered_button
+
+    def handle_buttons(self, screen: str, event: pygame.event.Event) -> Optional[str]:
+        """Update button hover states and return the key of the button clicked on screen, if any"""
+        if event.type != pygame.MOUSEMOTION and event.type != pygame.MOUSEBUTTONDOWN:
+            return None
+        index = pygame.Rect(event.pos, (1, 1)).collidelist(self.button_rects[screen])
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            return self.button_keys[screen][index] if index >= 0 else None
+
+        # Only the buttons entered and left change state
+        hovered = self.button_groups[screen][index] if index >= 0 else None
+        if hovered is not self.hovered_button:
+            if self.hovered_button:
+                self.hovered_button.is_hovered = False
+            if hovered:
+                hovered.is_hovered = True
+            self.hovered_button = hovered
+        return None
 
     def handle_menu_events(self, event):
         """Handle menu events"""
-        if self.buttons['start'].handle_event(event):
+        clicked = self.handle_buttons('menu', event)
+        if clicked == 'start':
             self.play_sound('click')
             self.state = GameState.MODE_SELECT
-        elif self.buttons['exit'].handle_event(event):
+        elif clicked == 'exit':
             self.running = False
 
     def handle_mode_select_events(self, event):
         """Handle mode selection events"""
-        if self.buttons['single'].handle_event(event):
+        clicked = self.handle_buttons('mode_select', event)
+        if clicked == 'single':
             self.play_sound('click')
             self.game_mode = 'single'
             self.state = GameState.DIFFICULTY_SELECT
-        elif self.buttons['two_player'].handle_event(event):
+        elif clicked == 'two_player':
             self.play_sound('click')
             self.game_mode = 'two_player'
             self.state = GameState.NAME_INPUT
-        elif self.buttons['back'].handle_event(event):
+        elif clicked == 'back':
             self.play_sound('click')
             self.state = GameState.MENU
 
     def handle_difficulty_select_events(self, event):
         """Handle difficulty selection events"""
-        if self.buttons['easy'].handle_event(event):
+        clicked = self.handle_buttons('difficulty_select', event)
+        if clicked == 'easy':
             self.play_sound('click')
             self.difficulty = Difficulty.EASY
             self.state = GameState.NAME_INPUT
-        elif self.buttons['medium'].handle_event(event):
+        elif clicked == 'medium':
             self.play_sound('click')
             self.difficulty = Difficulty.MEDIUM
             self.state = GameState.NAME_INPUT
-        elif self.buttons['hard'].handle_event(event):
+        elif clicked == 'hard':
             self.play_sound('click')
             self.difficulty = Difficulty.HARD
             self.state = GameState.NAME_INPUT
-        elif self.buttons['back'].handle_event(event):
+        elif clicked == 'back':
             self.play_sound('click')
             self.state = GameState.MODE_SELECT
 
@@ -384,7 +745,7 @@ class GameManager:
                         self.input_boxes['player2'].text.strip()):
                     self.start_two_player_game()
 
-        if self.buttons['back'].handle_event(event):
+        if self.handle_buttons('name_input', event) == 'back':
             self.play_sound('click')
             if self.game_mode == 'single':
                 self.state = GameState.DIFFICULTY_SELECT
@@ -394,17 +755,18 @@ class GameManager:
     def handle_game_events(self, event):
         """Handle game playing events"""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.winner is None:
+            if self.winner is None and not self.ai_pending:
                 self.handle_board_click(event.pos)
         elif event.type == pygame.MOUSEMOTION:
             self.handle_board_hover(event.pos)
 
     def handle_game_over_events(self, event):
         """Handle game over events"""
-        if self.buttons['play_again'].handle_event(event):
+        clicked = self.handle_buttons('game_over', event)
+        if clicked == 'play_again':
             self.play_sound('click')
             self.reset_game()
-        elif self.buttons['main_menu'].handle_event(event):
+        elif clicked == 'main_menu':
             self.play_sound('click')
             self.reset_to_menu()
 
@@ -415,7 +777,7 @@ class GameManager:
             col = (x - BOARD_X) // CELL_SIZE
             row = (y - BOARD_Y) // CELL_SIZE
 
-            if 0 <= row < 3 and 0 <= col < 3 and self.board[row][col] == '':
+            if 0 <= row < 3 and 0 <= col < 3 and self.cell(row, col) == '':
                 self.make_move(row, col)
 
     def handle_board_hover(self, pos: Tuple[int, int]):
@@ -424,17 +786,22 @@ class GameManager:
         if BOARD_X <= x <= BOARD_X + BOARD_SIZE and BOARD_Y <= y <= BOARD_Y + BOARD_SIZE:
             col = (x - BOARD_X) // CELL_SIZE
             row = (y - BOARD_Y) // CELL_SIZE
-            if 0 <= row < 3 and 0 <= col < 3 and self.board[row][col] == '':
+            if 0 <= row < 3 and 0 <= col < 3 and self.cell(row, col) == '':
                 self.cell_hover = (row, col)
             else:
                 self.cell_hover = None
         else:
             self.cell_hover = None
 
+    def cell(self, row: int, col: int) -> str:
+        """Get the symbol at (row, col), or '' if empty"""
+        return self.board[row * 3 + col]
+
     def make_move(self, row: int, col: int):
         """Make a move on the board"""
-        if self.board[row][col] == '' and self.winner is None:
-            self.board[row][col] = self.current_player
+        if self.cell(row, col) == '' and self.winner is None:
+            self.board[row * 3 + col] = self.current_player
+            self.move_count += 1
             self.play_sound('move')
 
             # Check for winner
@@ -444,16 +811,28 @@ class GameManager:
                 # Switch player
                 self.current_player = 'O' if self.current_player == 'X' else 'X'
 
-                # AI move if single player mode
+                # Schedule AI move if single player mode
                 if self.game_mode == 'single' and self.current_player == 'O':
-                    self.make_ai_move()
+                    self.ai_move_at = pygame.time.get_ticks() + AI_MOVE_DELAY
+                    self.ai_pending = True
+
+    def update(self):
+        """Advance timed game logic once per frame"""
+        if self.ai_pending and pygame.time.get_ticks() >= self.ai_move_at:
+            self.ai_pending = False
+            self.make_ai_move()
+            self.dirty = True
+
+        # The winning line animates every frame
+        if self.winning_line:
+            self.dirty = True
 
     def make_ai_move(self):
         """Make AI move"""
         if self.ai and self.winner is None:
             row, col = self.ai.get_move(self.board)
-            pygame.time.wait(500)  # Small delay for better UX
-            self.board[row][col] = 'O'
+            self.board[row * 3 + col] = 'O'
+            self.move_count += 1
             self.play_sound('move')
             self.check_game_over()
             if self.winner is None:
@@ -461,36 +840,17 @@ class GameManager:
 
     def check_game_over(self):
         """Check if game is over"""
-        # Check rows
-        for i, row in enumerate(self.board):
-            if row[0] == row[1] == row[2] and row[0] != '':
-                self.winner = row[0]
-                self.winning_line = ('row', i)
-                self.handle_game_end()
-                return
-
-        # Check columns
-        for j in range(3):
-            if self.board[0][j] == self.board[1][j] == self.board[2][j] and self.board[0][j] != '':
-                self.winner = self.board[0][j]
-                self.winning_line = ('col', j)
+        # Check rows, columns and diagonals
+        board = self.board
+        for (a, b, c), line in zip(WIN_INDICES, WIN_LINES):
+            if board[a] == board[b] == board[c] != '':
+                self.winner = board[a]
+                self.winning_line = line
                 self.handle_game_end()
                 return
 
-        # Check diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] and self.board[0][0] != '':
-            self.winner = self.board[0][0]
-            self.winning_line = ('diag', 0)
-            self.handle_game_end()
-            return
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] and self.board[0][2] != '':
-            self.winner = self.board[0][2]
-            self.winning_line = ('diag', 1)
-            self.handle_game_end()
-            return
-
         # Check for draw
-        if all(self.board[i][j] != '' for i in range(3) for j in range(3)):
+        if self.move_count == 9:
             self.winner = 'Draw'
             self.handle_game_end()
 
@@ -507,6 +867,43 @@ class GameManager:
             else:
                 self.player2.score += 1
 
+        self.enter_game_over()
+
+    def enter_game_over(self):
+        """Switch to the game over screen, rendering its text once"""
+        # Result text
+        if self.winner == 'Draw':
+            result_text = "It's a Draw!"
+            color = ORANGE
+        elif self.winner == 'X':
+            result_text = f"{self.player1.name} Wins!"
+            color = GREEN
+        else:  # winner == 'O'
+            if self.game_mode == 'single':
+                result_text = "AI Wins!"
+            else:
+                result_text = f"{self.player2.name} Wins!"
+            color = GREEN
+
+        # Final scores
+        if self.game_mode == 'two_player':
+            score_text = f"{self.player1.name}: {self.player1.score}  |  {self.player2.name}: {self.player2.score}"
+        else:
+            ai_score = 0  # Placeholder - you might want to track this
+            score_text = f"{self.player1.name}: {self.player1.score}  |  AI: {ai_score}"
+
+        # Pre-render everything drawn over the board: the dimming overlay,
+        # the text and the buttons in their normal state
+        center_x = self.center_x
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 128))
+        layer_blits = [
+            self.render_text('large', result_text, color, (center_x, 200)),
+            self.render_text('medium', score_text, WHITE, (center_x, 350)),
+        ]
+        layer_blits += [(button.normal_surface, button.rect) for button in self.button_groups['game_over']]
+        layer.blits(layer_blits, doreturn=False)
+        self.game_over_layer = layer
         self.state = GameState.GAME_OVER
 
     def start_single_player_game(self):
@@ -528,10 +925,12 @@ class GameManager:
 
     def reset_game(self):
         """Reset game for new round"""
-        self.board = [['', '', ''] for _ in range(3)]
+        self.board = [''] * 9
+        self.move_count = 0
         self.current_player = 'X'
         self.winner = None
         self.winning_line = None
+        self.ai_pending = False
         self.state = GameState.PLAYING
 
     def reset_to_menu(self):
@@ -548,92 +947,63 @@ class GameManager:
         for input_box in self.input_boxes.values():
             input_box.text = ""
 
+        # Drop text rendered with the old player names
+        self.text_cache.clear()
+        self.last_scores = None
+
     def play_sound(self, sound_name: str):
         """Play sound effect"""
-        if sound_name in self.sounds and self.sounds[sound_name]:
-            self.sounds[sound_name].play()
+        self.sounds.get(sound_name, SILENT_SOUND).play()
 
-    def draw(self):
-        """Main draw method"""
+    def draw(self) -> List[pygame.Rect]:
+        """Main draw method, returning the areas of the display to update"""
         self.screen.fill(WHITE)
+        self.draw_handlers[self.state]()
 
-        if self.state == GameState.MENU:
-            self.draw_menu()
-        elif self.state == GameState.MODE_SELECT:
-            self.draw_mode_select()
-        elif self.state == GameState.DIFFICULTY_SELECT:
-            self.draw_difficulty_select()
-        elif self.state == GameState.NAME_INPUT:
-            self.draw_name_input()
-        elif self.state == GameState.PLAYING:
-            self.draw_game()
-        elif self.state == GameState.GAME_OVER:
-            self.draw_game_over()
-
-        pygame.display.flip()
+        # A new screen replaces everything; otherwise only its changing parts
+        if self.state != self.drawn_state:
+            self.drawn_state = self.state
+            return [self.screen_rect]
+        return self.update_rects[self.state]
 
     def draw_menu(self):
         """Draw main menu"""
-        title = self.fonts['title'].render("Tic-Tac-Toe", True, BLACK)
-        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 150))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(*self.titles['menu'])
 
-        self.buttons['start'].draw(self.screen)
-        self.buttons['exit'].draw(self.screen)
+        Button.draw_many(self.screen, self.button_groups['menu'])
 
     def draw_mode_select(self):
         """Draw mode selection screen"""
-        title = self.fonts['large'].render("Select Game Mode", True, BLACK)
-        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(*self.titles['mode_select'])
 
-        self.buttons['single'].draw(self.screen)
-        self.buttons['two_player'].draw(self.screen)
-        self.buttons['back'].draw(self.screen)
+        Button.draw_many(self.screen, self.button_groups['mode_select'])
 
     def draw_difficulty_select(self):
         """Draw difficulty selection screen"""
-        title = self.fonts['large'].render("Select Difficulty", True, BLACK)
-        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(*self.titles['difficulty_select'])
 
-        self.buttons['easy'].draw(self.screen)
-        self.buttons['medium'].draw(self.screen)
-        self.buttons['hard'].draw(self.screen)
-        self.buttons['back'].draw(self.screen)
+        Button.draw_many(self.screen, self.button_groups['difficulty_select'])
 
     def draw_name_input(self):
         """Draw name input screen"""
         if self.game_mode == 'single':
-            title = self.fonts['large'].render("Enter Your Name", True, BLACK)
-            title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 150))
-            self.screen.blit(title, title_rect)
-
+            self.screen.blit(*self.titles['name_single'])
             self.input_boxes['single_player'].draw(self.screen)
-
-            instruction = self.fonts['medium'].render("Press Enter to start", True, GRAY)
-            instruction_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, 280))
-            self.screen.blit(instruction, instruction_rect)
+            self.screen.blit(*self.titles['start_single'])
         else:
-            title = self.fonts['large'].render("Enter Player Names", True, BLACK)
-            title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 150))
-            self.screen.blit(title, title_rect)
-
+            self.screen.blit(*self.titles['name_two'])
             self.input_boxes['player1'].draw(self.screen)
             self.input_boxes['player2'].draw(self.screen)
-
-            instruction = self.fonts['medium'].render("Press Enter to start", True, GRAY)
-            instruction_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, 320))
-            self.screen.blit(instruction, instruction_rect)
+            self.screen.blit(*self.titles['start_two'])
 
         self.buttons['back'].draw(self.screen)
 
     def draw_game(self):
         """Draw game screen"""
+        screen = self.screen
+
         # Draw title
-        title = self.fonts['large'].render("Tic-Tac-Toe", True, BLACK)
-        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 30))
-        self.screen.blit(title, title_rect)
+        screen.blit(*self.titles['game'])
 
         # Draw current turn
         if self.winner is None:
@@ -645,9 +1015,7 @@ class GameManager:
                 else:
                     current_text = f"{self.player2.name}'s Turn (O)"
 
-            turn_surface = self.fonts['medium'].render(current_text, True, BLACK)
-            turn_rect = turn_surface.get_rect(center=(WINDOW_WIDTH // 2, 70))
-            self.screen.blit(turn_surface, turn_rect)
+            screen.blit(*self.render_cached('medium', current_text, BLACK, (self.center_x, 70)))
 
         # Draw board
         self.draw_board()
@@ -657,19 +1025,10 @@ class GameManager:
 
     def draw_board(self):
         """Draw the game board"""
-        # Draw grid lines
-        for i in range(1, 3):
-            # Vertical lines
-            pygame.draw.line(self.screen, BLACK,
-                             (BOARD_X + i * CELL_SIZE, BOARD_Y),
-                             (BOARD_X + i * CELL_SIZE, BOARD_Y + BOARD_SIZE), 3)
-            # Horizontal lines
-            pygame.draw.line(self.screen, BLACK,
-                             (BOARD_X, BOARD_Y + i * CELL_SIZE),
-                             (BOARD_X + BOARD_SIZE, BOARD_Y + i * CELL_SIZE), 3)
+        screen = self.screen
 
-        # Draw board border
-        pygame.draw.rect(self.screen, BLACK, (BOARD_X, BOARD_Y, BOARD_SIZE, BOARD_SIZE), 3)
+        # Draw grid lines and border
+        screen.blit(self.board_surface, (BOARD_X, BOARD_Y))
 
         # Draw hover effect
         if self.cell_hover and self.winner is None:
@@ -677,45 +1036,28 @@ class GameManager:
             hover_rect = pygame.Rect(BOARD_X + col * CELL_SIZE + 2,
                                      BOARD_Y + row * CELL_SIZE + 2,
                                      CELL_SIZE - 4, CELL_SIZE - 4)
-            pygame.draw.rect(self.screen, LIGHT_GRAY, hover_rect)
+            pygame.draw.rect(screen, LIGHT_GRAY, hover_rect)
 
         # Draw X's and O's
-        for row in range(3):
-            for col in range(3):
-                if self.board[row][col] != '':
-                    self.draw_symbol(row, col, self.board[row][col])
+        symbol_surfaces = self.symbol_surfaces
+        for i, symbol in enumerate(self.board):
+            if symbol != '':
+                row, col = divmod(i, 3)
+                screen.blit(symbol_surfaces[symbol], (BOARD_X + col * CELL_SIZE, BOARD_Y + row * CELL_SIZE))
 
         # Draw winning line
         if self.winning_line:
             self.draw_winning_line()
 
-    def draw_symbol(self, row: int, col: int, symbol: str):
-        """Draw X or O symbol"""
-        center_x = BOARD_X + col * CELL_SIZE + CELL_SIZE // 2
-        center_y = BOARD_Y + row * CELL_SIZE + CELL_SIZE // 2
-
-        if symbol == 'X':
-            # Draw X
-            margin = 30
-            pygame.draw.line(self.screen, RED,
-                             (center_x - margin, center_y - margin),
-                             (center_x + margin, center_y + margin), 8)
-            pygame.draw.line(self.screen, RED,
-                             (center_x + margin, center_y - margin),
-                             (center_x - margin, center_y + margin), 8)
-        elif symbol == 'O':
-            # Draw O
-            pygame.draw.circle(self.screen, BLUE, (center_x, center_y), 40, 8)
-
     def draw_winning_line(self):
         """Draw winning line animation"""
         if not self.winning_line:
             return
 
         # Animate winning line with pulsing effect
-        self.animation_timer += 1
-        alpha = int(128 + 127 * math.sin(self.animation_timer * 0.1))
-        color = (*GREEN, alpha) if self.animation_timer % 60 < 30 else (*YELLOW, alpha)
+        self.animation_timer += self.animation_step
+        color = self.pulse_colors[0] if self.animation_timer % 60 < 30 else self.pulse_colors[1]
+        color.a = int(128 + 127 * math.sin(self.animation_timer * 0.1))
 
         line_type, index = self.winning_line
 
@@ -723,13 +1065,13 @@ class GameManager:
             start_x = BOARD_X + 10
             end_x = BOARD_X + BOARD_SIZE - 10
             y = BOARD_Y + index * CELL_SIZE + CELL_SIZE // 2
-            pygame.draw.line(self.screen, color[:3], (start_x, y), (end_x, y), 6)
+            pygame.draw.line(self.screen, color, (start_x, y), (end_x, y), 6)
 
         elif line_type == 'col':
             x = BOARD_X + index * CELL_SIZE + CELL_SIZE // 2
             start_y = BOARD_Y + 10
             end_y = BOARD_Y + BOARD_SIZE - 10
-            pygame.draw.line(self.screen, color[:3], (x, start_y), (x, end_y), 6)
+            pygame.draw.line(self.screen, color, (x, start_y), (x, end_y), 6)
 
         elif line_type == 'diag':
             if index == 0:  # Main diagonal
@@ -738,93 +1080,99 @@ class GameManager:
             else:  # Anti-diagonal
                 start_pos = (BOARD_X + BOARD_SIZE - 10, BOARD_Y + 10)
                 end_pos = (BOARD_X + 10, BOARD_Y + BOARD_SIZE - 10)
-            pygame.draw.line(self.screen, color[:3], start_pos, end_pos, 6)
+            pygame.draw.line(self.screen, color, start_pos, end_pos, 6)
 
     def draw_scores(self):
         """Draw player scores"""
         if not self.player1:
             return
 
-        # Player 1 score
-        score_text = f"{self.player1.name}: {self.player1.score}"
-        score_surface = self.fonts['medium'].render(score_text, True, BLACK)
-        self.screen.blit(score_surface, (50, 150))
-
-        # Player 2 or AI score
-        if self.game_mode == 'two_player' and self.player2:
-            score_text = f"{self.player2.name}: {self.player2.score}"
-            score_surface = self.fonts['medium'].render(score_text, True, BLACK)
-            self.screen.blit(score_surface, (50, 180))
-        elif self.game_mode == 'single':
-            ai_wins = sum(1 for _ in range(10)) - self.player1.score  # Placeholder for AI wins
-            score_text = f"AI: {ai_wins if ai_wins > 0 else 0}"
-            score_surface = self.fonts['medium'].render(score_text, True, BLACK)
-            self.screen.blit(score_surface, (50, 180))
+        # Only re-render the score lines when the mode or a score has changed
+        scores = (self.game_mode, self.player1.score, self.player2.score if self.player2 else None)
+        if scores != self.last_scores:
+            self.last_scores = scores
+            medium = self.fonts['medium']
+
+            # Player 1 score
+            score_text = f"{self.player1.name}: {self.player1.score}"
+            self.score_blits = [(medium.render(score_text, True, BLACK).convert_alpha(), (50, 150))]
+
+            # Player 2 or AI score
+            if self.game_mode == 'two_player' and self.player2:
+                score_text = f"{self.player2.name}: {self.player2.score}"
+                self.score_blits.append((medium.render(score_text, True, BLACK).convert_alpha(), (50, 180)))
+            elif self.game_mode == 'single':
+                ai_wins = sum(1 for _ in range(10)) - self.player1.score  # Placeholder for AI wins
+                score_text = f"AI: {ai_wins if ai_wins > 0 else 0}"
+                self.score_blits.append((medium.render(score_text, True, BLACK).convert_alpha(), (50, 180)))
+
+        self.screen.blits(self.score_blits, doreturn=False)
 
     def draw_game_over(self):
         """Draw game over screen"""
+        screen = self.screen
+
         # Draw the game board in background
         self.draw_game()
 
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        # Draw the overlay, text and buttons. The layer's colors already have
+        # its alpha applied, so it is blended as premultiplied.
+        screen.blit(self.game_over_layer, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
 
-        # Draw result text
-        if self.winner == 'Draw':
-            result_text = "It's a Draw!"
-            color = ORANGE
-        elif self.winner == 'X':
-            result_text = f"{self.player1.name} Wins!"
-            color = GREEN
-        else:  # winner == 'O'
-            if self.game_mode == 'single':
-                result_text = "AI Wins!"
-            else:
-                result_text = f"{self.player2.name} Wins!"
-            color = GREEN
+        # Only a hovered button differs from the pre-rendered layer
+        Button.draw_many(screen, [button for button in self.button_groups['game_over'] if button.is_hovered])
 
-        result_surface = self.fonts['large'].render(result_text, True, color)
-        result_rect = result_surface.get_rect(center=(WINDOW_WIDTH // 2, 200))
-        self.screen.blit(result_surface, result_rect)
+    @staticmethod
+    def get_refresh_rate() -> int:
+        """Get the desktop's refresh rate in Hz, or FPS if it cannot be queried"""
+        # get_desktop_refresh_rates is only available in pygame-ce
+        get_refresh_rates = getattr(pygame.display, 'get_desktop_refresh_rates', None)
+        rates = get_refresh_rates() if get_refresh_rates else []
+        return rates[0] if rates and rates[0] > 0 else FPS
 
-        # Draw final scores
-        if self.game_mode == 'two_player':
-            score_text = f"{self.player1.name}: {self.player1.score}  |  {self.player2.name}: {self.player2.score}"
-        else:
-            ai_score = 0  # Placeholder - you might want to track this
-            score_text = f"{self.player1.name}: {self.player1.score}  |  AI: {ai_score}"
+    def wait_for_frame(self, deadline: int) -> int:
+        """Wait until deadline (in perf_counter_ns time) and return the next frame's deadline"""
+        remaining = deadline - time.perf_counter_ns()
+        if remaining > 2_000_000:
+            time.sleep((remaining - 1_000_000) / 1e9)
 
-        score_surface = self.fonts['medium'].render(score_text, True, WHITE)
-        score_rect = score_surface.get_rect(center=(WINDOW_WIDTH // 2, 350))
-        self.screen.blit(score_surface, score_rect)
+        # Spin through the last millisecond, which sleep() may overshoot
+        while time.perf_counter_ns() < deadline:
+            pass
 
-        # Draw buttons
-        self.buttons['play_again'].draw(self.screen)
-        self.buttons['main_menu'].draw(self.screen)
+        # After a slow frame, start again from now rather than rushing to catch up
+        return max(deadline, time.perf_counter_ns()) + self.frame_ns
 
     def run(self):
         """Main game loop"""
-        while self.running:
-            self.handle_events()
-            self.draw()
-            self.clock.tick(60)
-
-        pygame.quit()
-        sys.exit()
+        next_frame = time.perf_counter_ns() + self.frame_ns
+        try:
+            while self.running:
+                self.handle_events()
+                self.update()
+                if self.dirty:
+                    pygame.display.update(self.draw())
+                    self.dirty = False
+                next_frame = self.wait_for_frame(next_frame)
+        finally:
+            pygame.display.quit()
+            if pygame.mixer.get_init():
+                pygame.mixer.quit()
+
+        # Skip interpreter teardown (fonts, atexit handlers) so the window closes immediately
+        os._exit(0)
 
 
 def main():
     """Main function to start the game"""
     try:
         game = GameManager()
-        game.run()
     except Exception as e:
-        print(f"Error running game: {e}")
+        print(f"Error starting game: {e}")
         pygame.quit()
-        sys.exit()
+        sys.exit(1)
+
+    game.run()
 
 
 if __name__ == "__main__":